@@ -0,0 +1,123 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Native log parser for report.py (optional – build with `make pyext`).
+
+parse(buf) follows the same rules as report._parse_lines(): the 4- vs
+≥8-column layout is fixed by the first line that has either, and lines of
+the other layout, blank / '#' lines and lines with a field that is not a
+plain integer / finite decimal (nan, inf, hex, 1.0 for a count) are skipped.
+The scan runs without the GIL, so report.py can parse several files at once
+from a thread pool.
+"""
+
+from libc.limits cimport INT_MAX, INT_MIN
+from libc.stdlib cimport strtod, strtoll
+
+import numpy as np
+
+
+cdef inline bint _is_space(char c) noexcept nogil:
+    return c == 32 or (9 <= c <= 13)                # ' ', \t \n \v \f \r
+
+
+cdef Py_ssize_t _tokenize(const char* s, Py_ssize_t i, Py_ssize_t e,
+                          Py_ssize_t* tok_s, Py_ssize_t* tok_e) noexcept nogil:
+    """Record the first 8 token spans of s[i:e]; return the token count (0 for '#' lines)."""
+    cdef Py_ssize_t ntok = 0, start
+    while i < e:
+        if _is_space(s[i]):
+            i += 1
+            continue
+        if ntok == 0 and s[i] == 35:                # leading '#'
+            return 0
+        start = i
+        while i < e and not _is_space(s[i]):
+            i += 1
+        if ntok < 8:
+            tok_s[ntok] = start
+            tok_e[ntok] = i
+        ntok += 1
+    return ntok
+
+
+cdef inline bint _to_int(const char* s, Py_ssize_t a, Py_ssize_t b, int* out) noexcept nogil:
+    cdef char* end
+    cdef long long v = strtoll(s + a, &end, 10)     # saturates far outside int on overflow
+    if end != s + b or v < INT_MIN or v > INT_MAX:  # whole token consumed, fits in int32
+        return False
+    out[0] = <int>v
+    return True
+
+
+cdef inline bint _to_double(const char* s, Py_ssize_t a, Py_ssize_t b, double* out) noexcept nogil:
+    cdef char* end
+    cdef Py_ssize_t i
+    for i in range(a, b):                           # keep strtod off nan / inf / 0x…
+        if not (48 <= s[i] <= 57 or s[i] == 46 or s[i] == 43 or s[i] == 45
+                or s[i] == 101 or s[i] == 69):      # 0-9 . + - e E
+            return False
+    out[0] = strtod(s + a, &end)
+    return end == s + b
+
+
+cdef inline Py_ssize_t _line_end(const char* s, Py_ssize_t i, Py_ssize_t n) noexcept nogil:
+    while i < n and s[i] != 10:
+        i += 1
+    return i
+
+
+cpdef tuple parse(bytes buf):
+    """Return (blkerr int32, biterrs int32, enc float32, dec float32) parsed from *buf*."""
+    cdef const char* s = buf                        # bytes are NUL-terminated → strto* stop
+    cdef Py_ssize_t n = len(buf)
+    cdef Py_ssize_t n_lines = buf.count(b"\n") + 1
+
+    blkerr = np.empty(n_lines, dtype=np.int32)
+    biterrs = np.empty(n_lines, dtype=np.int32)
+    enc = np.empty(n_lines, dtype=np.float32)
+    dec = np.empty(n_lines, dtype=np.float32)
+    cdef int[::1] be_v = blkerr
+    cdef int[::1] bi_v = biterrs
+    cdef float[::1] et_v = enc
+    cdef float[::1] dt_v = dec
+
+    cdef Py_ssize_t tok_s[8]
+    cdef Py_ssize_t tok_e[8]
+    cdef Py_ssize_t i, e, ntok, off = -1, k = 0
+    cdef int be, bi
+    cdef double et, dt
+
+    with nogil:
+        # ---- layout from the first recognisable line ------------------
+        i = 0
+        while i < n:
+            e = _line_end(s, i, n)
+            ntok = _tokenize(s, i, e, tok_s, tok_e)
+            if ntok == 4:                           # blkerr biterrs enc dec
+                off = 0
+                break
+            if ntok >= 8:                           # k n esno nblk blk bit enc dec
+                off = 4
+                break
+            i = e + 1
+
+        # ---- parse every line of that layout --------------------------
+        i = 0
+        while off >= 0 and i < n:
+            e = _line_end(s, i, n)
+            ntok = _tokenize(s, i, e, tok_s, tok_e)
+            i = e + 1
+            if (ntok != 4) if off == 0 else (ntok < 8):
+                continue
+            if not (_to_int(s, tok_s[off], tok_e[off], &be)
+                    and _to_int(s, tok_s[off + 1], tok_e[off + 1], &bi)
+                    and _to_double(s, tok_s[off + 2], tok_e[off + 2], &et)
+                    and _to_double(s, tok_s[off + 3], tok_e[off + 3], &dt)):
+                continue
+            be_v[k] = be
+            bi_v[k] = bi
+            et_v[k] = <float>et
+            dt_v[k] = <float>dt
+            k += 1
+
+    return blkerr[:k].copy(), biterrs[:k].copy(), enc[:k].copy(), dec[:k].copy()
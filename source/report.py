@@ -15,11 +15,23 @@ python report.py --bits-per-block 1024 run1.log run2.log
 from __future__ import annotations
 
 import argparse
+import io
+import mmap
+import multiprocessing
+import os
+import re
+import tempfile
+import warnings
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages          # NEW
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path as MplPath
 
 # helper for an N-colour colormap without deprecation warnings
 def _get_discrete_cmap(name: str, n: int):
@@ -28,18 +40,121 @@ def _get_discrete_cmap(name: str, n: int):
     except AttributeError:                  # backward compatibility
         return plt.cm.get_cmap(name, n)
 
+# equal-width binning by index arithmetic – skips np.histogram's search path
+# (float32 / uint16 timing data stays in its own width; the scaling runs in
+# float64, one cache-sized block at a time, and the edges are float64)
+_HIST_BLOCK = 65536
+
+def _fast_hist(x: np.ndarray, bins: int, *, density: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    if x.size == 0:
+        return np.zeros(bins, dtype=np.intp), np.linspace(0.0, 1.0, bins + 1)
+    lo, hi = float(x.min()), float(x.max())
+    if lo == hi:                            # same fallback range as np.histogram
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, bins + 1)
+    if x.dtype.kind in "ui" and hi - lo <= _HIST_BLOCK:
+        # whole-µs times: bin each distinct value once, then add up its samples
+        base = x.min()
+        per_value = np.bincount(x - base)
+        idx = _bin_index(np.arange(int(base), int(base) + per_value.size), lo, hi, edges)
+        counts = np.bincount(idx, weights=per_value, minlength=bins).astype(np.intp)
+    else:
+        counts = np.bincount(_bin_index(x, lo, hi, edges), minlength=bins)
+    if density:
+        counts = counts / (x.size * np.diff(edges))
+    return counts, edges
+
+def _bin_index(x: np.ndarray, lo: float, hi: float, edges: np.ndarray) -> np.ndarray:
+    """Bin of every sample of *x* for the equal-width *edges* spanning lo‥hi."""
+    bins = edges.size - 1
+    scale = bins / (hi - lo)
+    # the scaled index can be one off within an ulp of an edge; anything within
+    # `near` of one (far above the rounding error of the scaling and of the
+    # edges) is settled against that edge itself, as np.histogram does
+    near = bins * (1.0 + (abs(lo) + abs(hi)) / (hi - lo)) * 2.0 ** -40
+    idx = np.empty(x.size, dtype=np.intp)
+    buf = np.empty(min(x.size, _HIST_BLOCK))
+    for i in range(0, x.size, _HIST_BLOCK):
+        xb = x[i:i + _HIST_BLOCK]
+        t = buf[:xb.size]
+        np.subtract(xb, lo, out=t, dtype=np.float64)
+        t *= scale
+        ib = idx[i:i + _HIST_BLOCK]
+        ib[...] = t                         # truncates, like astype(np.intp)
+        t -= ib                             # position within the bin, 0‥1
+        fix = np.flatnonzero((t < near) | (t > 1.0 - near))
+        if fix.size:
+            e = ib[fix] + (t[fix] > 0.5)        # the edge the sample sits next to
+            e -= xb[fix] < edges[e]             # left of it → the bin below
+            np.minimum(e, bins - 1, out=e)      # x == hi belongs to the last bin
+            ib[fix] = e
+    return idx
+
+# one PathPatch per histogram instead of one Rectangle per bin
+def _draw_bars(ax, counts: np.ndarray, edges: np.ndarray, color: str) -> PathPatch:
+    left, right = edges[:-1], edges[1:]
+    bottom = np.zeros_like(counts)
+    xy = np.array([[left, left, right, right], [bottom, counts, counts, bottom]]).T
+    patch = PathPatch(MplPath.make_compound_path_from_polys(xy),
+                      facecolor=color, edgecolor="black", alpha=0.7)
+    patch.sticky_edges.y.append(0)          # bars rest on the x-axis, like ax.hist
+    ax.add_patch(patch)
+    ax.autoscale_view()                     # add_patch does not rescale on its own
+    return patch
+
+def _draw_hist(ax, data: np.ndarray, bins: int, color: str, *, density: bool = False) -> PathPatch:
+    return _draw_bars(ax, *_fast_hist(data, bins, density=density), color)
+
 try:
     from scipy.stats import gaussian_kde            # KDE helper
 except ImportError:                                 # fail-gracefully
     gaussian_kde = None
 
+try:
+    from _parse_log import parse as _parse_native   # Cython parser, built by `make pyext`
+except ImportError:                                 # pure-Python / Numba paths instead
+    _parse_native = None
+
+# Numba (JIT for the log-line scanner) and pandas (chunked C-engine text reader)
+# cost ~0.4 s to import, so they are only pulled in by the parsers that use them.
+_UNLOADED = object()
+numba = _UNLOADED                                   # None → plain NumPy parsing instead
+pd = _UNLOADED                                      # None → np.loadtxt instead
+
+
+def _numba():
+    """Return the numba module, importing it on first use (None if not installed)."""
+    global numba
+    if numba is _UNLOADED:
+        try:
+            import numba as mod
+        except ImportError:
+            mod = None
+        numba = mod
+    return numba
+
+
+def _pandas():
+    """Return the pandas module, importing it on first use (None if not installed)."""
+    global pd
+    if pd is _UNLOADED:
+        try:
+            import pandas as mod
+        except ImportError:
+            mod = None
+        pd = mod
+    return pd
+
 import math  # NEW
 
 
 def parse_logs(*paths: str | Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    """Return blkerr, biterrs, enc_t, dec_t as NumPy arrays."""
-    blkerr_lst, biterrs_lst, enc_lst, dec_lst = [], [], [], []
+    """
+    Return blkerr, biterrs, enc_t, dec_t as NumPy arrays.
 
+    enc_t / dec_t are float32, or uint16 when every time is a whole number
+    of µs in 0‥65535 (halves the bytes pushed through histogram binning).
+    """
     # First resolve every argument into an explicit list of log files
     files: list[Path] = []
     for raw in paths:
@@ -72,51 +187,514 @@ def parse_logs(*paths: str | Path) -> tuple[np.ndarray, np.ndarray, np.ndarray,
         raise ValueError("No log files found after filtering.")
 
     # Now parse every discovered file
-    for p in files:
-        # tolerate odd encodings → silently drop undecodable bytes
+    def load(p: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         print(f"Parsing log file: {p}")
-        with p.open(encoding="utf-8", errors="ignore") as fh:
-            n_from_file = 0
-            for line in fh:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-
-                # ---- recognise line formats ---------------------------------
-                if len(parts) == 4:                       # blkerr biterrs enc dec
-                    try:
-                        be, bi        = map(int,   parts[:2])
-                        et, dt        = map(float, parts[2:4])
-                    except ValueError:
-                        continue
+        cols = _load_cached(p)
+        if cols[0].size == 0:
+            print(f"  ⚠️  no valid log lines found in {p}")
+        return cols
+
+    if _parse_native is not None and len(files) > 1 and multiprocessing.parent_process() is None:
+        # the native parser drops the GIL → threads parse files side by side
+        # (not inside a _load_stubs() worker: the process pool already fills the cores)
+        with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as ex:
+            parsed = list(ex.map(load, files))
+    else:
+        parsed = [load(p) for p in files]
 
-                elif len(parts) >= 8:                     # k n esno nblk blk bit enc dec
-                    try:
-                        be, bi        = map(int,   parts[4:6])
-                        et, dt        = map(float, parts[6:8])
-                    except ValueError:
-                        continue
-                else:
-                    continue
-                # ----------------------------------------------------------------
+    blkerr, biterrs, enc, dec = (np.concatenate(c) for c in zip(*parsed))
+    if blkerr.size == 0:
+        raise ValueError("No valid log entries parsed – nothing to plot.")
+    return blkerr, biterrs, _narrow_times(enc), _narrow_times(dec)
 
-                blkerr_lst.append(be)
-                biterrs_lst.append(bi)
-                enc_lst.append(et)
-                dec_lst.append(dt)
-                n_from_file += 1
 
-            if n_from_file == 0:
-                print(f"  ⚠️  no valid log lines found in {p}")
+def _narrow_times(t: np.ndarray) -> np.ndarray:
+    """Downcast float32 times to uint16 when that loses nothing."""
+    if t.min() < 0 or t.max() > np.iinfo(np.uint16).max:
+        return t
+    t16 = t.astype(np.uint16)
+    return t16 if np.array_equal(t16, t) else t
 
+
+_CACHE_SUFFIX = ".npz"         # parsed columns are cached next to each log as <log>.npz
+_CACHE_VERSION = 3             # bump whenever the parsing rules or the cached fields change
+
+def _load_cached(p: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the parsed columns of *p*, re-using <p>.npz when it is still valid.
+
+    The cache stores the log's mtime (ns) and size plus _CACHE_VERSION; if
+    any of them differs the log is re-parsed and the cache rewritten.
+    Unwritable directories simply go without a cache.
+    """
+    st = p.stat()
+    cache = p.with_name(p.name + _CACHE_SUFFIX)
+    try:
+        with np.load(cache) as z:
+            if (int(z["version"]) == _CACHE_VERSION
+                    and int(z["mtime_ns"]) == st.st_mtime_ns and int(z["size"]) == st.st_size):
+                return z["blkerr"], z["biterrs"], z["enc"], z["dec"]
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass                                        # missing / old / foreign / corrupt → re-parse
+
+    blkerr, biterrs, enc, dec = _read_columns(p)
+    try:                                            # unique name per writer, thread or process
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=cache.name + ".", suffix=".tmp")
+    except OSError:
+        return blkerr, biterrs, enc, dec
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, blkerr=blkerr, biterrs=biterrs, enc=enc, dec=dec,
+                     mtime_ns=st.st_mtime_ns, size=st.st_size, version=_CACHE_VERSION)
+        os.replace(tmp, cache)                      # readers never see a half-written file
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+    return blkerr, biterrs, enc, dec
+
+
+# Every parser below (native, Numba, pandas, loadtxt, per-line) follows the
+# same rules: lines end at '\n', tokens are split on ASCII whitespace, blank
+# lines and lines whose first token starts with '#' are skipped, blkerr /
+# biterrs must be plain integers within int32 and enc / dec finite decimals
+# (no nan/inf), and a line with any other field is dropped as a whole.
+_FLOAT_CHARS = b"0123456789+-.eE"                 # float() of these alone is that grammar
+_I32_MIN, _I32_MAX = -(1 << 31), (1 << 31) - 1
+
+
+def _data_lines(fh):
+    """Yield the token list of every non-blank, non-comment line of a log opened "rb"."""
+    for line in fh:
+        parts = line.split()                        # bytes.split(): ASCII whitespace only
+        if parts and parts[0][0] != 35:             # leading '#'
+            yield parts
+
+
+def _first_width(lines) -> int:
+    """Token count of the first line in a known layout (4, or ≥8); 0 if none."""
+    for parts in lines:
+        ntok = len(parts)
+        if ntok == 4 or ntok >= 8:
+            return ntok
+    return 0
+
+
+# Only runs of regular lines (blank, a comment, or exactly one well-formed row)
+# reach the C readers: they have their own notions of comments, numbers and
+# ragged rows, and never see anything those could disagree on.  The few other
+# lines go through the per-line rules instead.
+_WS = rb"[ \t]*"                                   # what pandas / loadtxt split on
+_SEP = rb"[ \t]+"
+_EOL = rb"\r?$"                                     # a lone '\r' ends a line for pandas
+_INT = rb"[+-]?[0-9]{1,9}"                         # longer counts may leave int32
+_FLOAT = rb"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+_LABEL = rb"[\x21\x24-\x7e]+"                      # k n esno nblk: printable, no '#' / '"'
+_IRREGULAR = {                                      # matches at the start of any other line
+    wide: re.compile(rb"(?m)^(?!" + _WS + rb"(?:#[^\r\n]*" + _EOL + rb"|" + _EOL + rb"|"
+                     + (_LABEL + _SEP) * (4 if wide else 0)
+                     + _INT + _SEP + _INT + _SEP + _FLOAT + _SEP + _FLOAT + _WS + _EOL + rb"))")
+    for wide in (False, True)
+}
+_MAX_IRREGULAR = 256           # beyond this many odd lines, parse the whole file per line
+
+
+def _irregular_lines(buf, wide: bool) -> list[tuple[int, int]] | None:
+    """(start, end) byte spans of the irregular lines in *buf*; None if there are too many."""
+    spans = []
+    for m in _IRREGULAR[wide].finditer(buf):
+        if len(spans) == _MAX_IRREGULAR:
+            return None
+        end = buf.find(b"\n", m.start())
+        spans.append((m.start(), len(buf) if end < 0 else end + 1))
+    return spans
+
+
+def _read_columns(p: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse one log file with a C tokenizer (pandas in chunks, else np.loadtxt).
+
+    The column layout (4-column log vs. ≥8-column summary line) is taken from
+    the first line that has either; lines of the other layout are skipped.  Only
+    regular lines reach the C readers; the odd ones out (stray text, ragged rows,
+    inline '#', nan) go through the per-line rules in place, or, if there are
+    many, the whole file does.
+    When the Cython extension is built, or else Numba is installed, a native
+    byte scanner handles every file instead.
+    """
+    if _parse_native is not None:
+        return _parse_native(p.read_bytes())
+    if _numba() is not None:
+        return _read_columns_jit(p)
+
+    with p.open("rb") as fh:
+        width = _first_width(_data_lines(fh))
+    if width == 0:
+        return _empty_columns()
+    wide = width >= 8                               # layout is uniform within a file
+
+    try:
+        with p.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            spans = _irregular_lines(mm, wide)
+            if not spans:
+                return _parse_lines(p, wide) if spans is None else _read_regular(p, wide)
+            rows = _rows8 if wide else _rows4
+            parts, pos = [], 0
+            for start, end in spans + [(len(mm), len(mm))]:
+                if start > pos:                     # run of regular lines → C reader
+                    parts.append(_read_regular(io.BytesIO(mm[pos:start]), wide))
+                parts.append(_collect(rows(_data_lines([mm[start:end]]))))
+                pos = end
+    except ValueError:
+        return _parse_lines(p, wide)
+    return tuple(np.concatenate(c) for c in zip(*parts))
+
+
+def _read_regular(src, wide: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run pandas (else np.loadtxt) over *src*, a path or binary stream of regular lines."""
+    if _pandas() is not None:
+        return _read_columns_chunked(src, wide)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)   # a comment-only run holds no data
+        arr = np.loadtxt(src, dtype=np.float64, comments="#", encoding="latin-1",
+                         usecols=(4, 5, 6, 7) if wide else None, ndmin=2)
+    if arr.size == 0:
+        return _empty_columns()
+    return (
+        arr[:, 0].astype(np.int32),
+        arr[:, 1].astype(np.int32),
+        arr[:, 2].astype(np.float32),
+        arr[:, 3].astype(np.float32),
+    )
+
+
+_CHUNK_ROWS = 1_000_000        # rows per pandas chunk → bounded peak memory
+
+def _read_columns_chunked(
+    src, wide: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Stream *src* (path or binary stream) through pandas' C parser, one chunk at a time."""
+    # Fixed names, so the column count is never inferred from a stray first line,
+    # and index_col=False, so surplus leading fields never become an index.
+    # 4-column files get a fifth, sentinel column: pandas truncates (first row)
+    # or skips (later rows) anything wider, and a filled sentinel marks the rest.
+    names, usecols = (range(8), (4, 5, 6, 7)) if wide else (range(5), None)
+    blkerr_lst, biterrs_lst, enc_lst, dec_lst = [], [], [], []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pd.errors.ParserWarning)   # the truncation above
+        reader = pd.read_csv(src, sep=r"\s+", comment="#", header=None, names=names,
+                             usecols=usecols, index_col=False, dtype=np.float64, encoding="latin-1",
+                             chunksize=_CHUNK_ROWS, engine="c", on_bad_lines="skip")
+        for chunk in reader:
+            if not wide:
+                chunk = chunk[chunk[4].isna()].iloc[:, :4]
+            arr = chunk.dropna().to_numpy()       # short lines come back as NaN
+            blkerr_lst.append(arr[:, 0].astype(np.int32))
+            biterrs_lst.append(arr[:, 1].astype(np.int32))
+            enc_lst.append(arr[:, 2].astype(np.float32))
+            dec_lst.append(arr[:, 3].astype(np.float32))
     if not blkerr_lst:
-        raise ValueError("No valid log entries parsed – nothing to plot.")
+        return _empty_columns()
+    return (
+        np.concatenate(blkerr_lst),
+        np.concatenate(biterrs_lst),
+        np.concatenate(enc_lst),
+        np.concatenate(dec_lst),
+    )
+
+
+def _read_columns_jit(p: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Memory-map *p* and run the compiled scanner over its raw bytes."""
+    _compile_kernels()
+    size = p.stat().st_size
+    if size == 0:                                   # mmap refuses empty files
+        return _empty_columns()
+    with p.open("rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = np.frombuffer(mm, dtype=np.uint8)     # raw ASCII, no codec involved
+        try:
+            nl = np.flatnonzero(buf == 0x0A)        # vectorised line split
+            line_start = np.concatenate(([0], nl + 1))
+            line_end = np.concatenate((nl, [size]))
+            width = _first_width_buf(buf, line_start, line_end)
+            if width == 0:
+                cols = _empty_columns()
+            elif width == 4:
+                cols = _parse_buffer4(buf, line_start, line_end)
+            else:
+                cols = _parse_buffer8(buf, line_start, line_end)
+        finally:
+            del buf                                 # release the export before mm closes
+            try:
+                mm.close()
+            except BufferError:                     # a propagating traceback still holds
+                pass                                # the view; unmapped once it is collected
+    return cols
+
+
+# ---------- compiled byte scanner (Numba) ----------------------------------
+_JIT_KERNELS: list[str] = []                        # kernels not compiled yet
+
+
+def _jit(fn):
+    """Register *fn* for compilation by _compile_kernels(); return it unchanged."""
+    _JIT_KERNELS.append(fn.__name__)
+    return fn
+
+
+def _compile_kernels() -> None:
+    """Swap every registered kernel for its Numba dispatcher (once, on first use).
+
+    njit() compiles lazily at the first call, so by then each kernel's calls to
+    the others already resolve to the swapped-in dispatchers.
+    """
+    g = globals()
+    while _JIT_KERNELS:
+        name = _JIT_KERNELS.pop()
+        g[name] = numba.njit(cache=True)(g[name])
+
+
+@_jit
+def _is_space(c):
+    return c == 32 or (9 <= c <= 13)                # ' ', \t \n \v \f \r
+
+
+@_jit
+def _scan_int(buf, s, e):
+    """Parse buf[s:e] as a signed decimal integer → (value, ok)."""
+    if s >= e:                                      # e.g. exponent of "1e" at EOF
+        return 0, False
+    neg = False
+    if buf[s] == 45 or buf[s] == 43:                # '-' / '+'
+        neg = buf[s] == 45
+        s += 1
+    if s >= e:
+        return 0, False
+    val = 0
+    for i in range(s, e):
+        d = buf[i] - 48
+        if d < 0 or d > 9:
+            return 0, False
+        val = min(val * 10 + d, 1 << 32)            # saturate well past int32, never wrap
+    return (-val if neg else val), True
+
+
+@_jit
+def _scan_float(buf, s, e):
+    """Parse buf[s:e] as a finite decimal float (optional fraction / exponent) → (value, ok)."""
+    neg = False
+    if buf[s] == 45 or buf[s] == 43:
+        neg = buf[s] == 45
+        s += 1
+    mant = 0.0
+    scale = 0
+    ndig = 0
+    i = s
+    while i < e and 48 <= buf[i] <= 57:
+        mant = mant * 10.0 + (buf[i] - 48)
+        ndig += 1
+        i += 1
+    if i < e and buf[i] == 46:                      # '.'
+        i += 1
+        while i < e and 48 <= buf[i] <= 57:
+            mant = mant * 10.0 + (buf[i] - 48)
+            scale -= 1
+            ndig += 1
+            i += 1
+    if ndig == 0:
+        return 0.0, False
+    if i < e and (buf[i] == 101 or buf[i] == 69):   # 'e' / 'E'
+        exp, ok = _scan_int(buf, i + 1, e)
+        if not ok:
+            return 0.0, False
+        scale += exp
+        i = e
+    if i != e:
+        return 0.0, False
+    val = mant * 10.0 ** scale
+    return (-val if neg else val), True
+
+
+@_jit
+def _tokenize(buf, i, e, tok_s, tok_e):
+    """
+    Record the first 8 token spans of buf[i:e] in tok_s / tok_e.
+
+    Returns the total token count, or 0 for blank and '#' comment lines.
+    """
+    ntok = 0
+    while i < e:
+        if _is_space(buf[i]):
+            i += 1
+            continue
+        if ntok == 0 and buf[i] == 35:              # leading '#'
+            return 0
+        s = i
+        while i < e and not _is_space(buf[i]):
+            i += 1
+        if ntok < 8:
+            tok_s[ntok] = s
+            tok_e[ntok] = i
+        ntok += 1
+    return ntok
+
+
+@_jit
+def _first_width_buf(buf, line_start, line_end):
+    """Byte-level _first_width(): first line with 4 or ≥8 tokens, else 0."""
+    tok_s = np.empty(8, dtype=np.int64)
+    tok_e = np.empty(8, dtype=np.int64)
+    for ln in range(line_start.shape[0]):
+        ntok = _tokenize(buf, line_start[ln], line_end[ln], tok_s, tok_e)
+        if ntok == 4 or ntok >= 8:
+            return ntok
+    return 0
+
+
+@_jit
+def _scan_fields(buf, tok_s, tok_e, off):
+    """Parse tokens off‥off+3 as blkerr biterrs enc dec → (be, bi, et, dt, ok)."""
+    be, ok0 = _scan_int(buf, tok_s[off], tok_e[off])
+    bi, ok1 = _scan_int(buf, tok_s[off + 1], tok_e[off + 1])
+    et, ok2 = _scan_float(buf, tok_s[off + 2], tok_e[off + 2])
+    dt, ok3 = _scan_float(buf, tok_s[off + 3], tok_e[off + 3])
+    in_range = _I32_MIN <= be <= _I32_MAX and _I32_MIN <= bi <= _I32_MAX
+    return be, bi, et, dt, ok0 and ok1 and ok2 and ok3 and in_range
+
+
+# The two kernels below differ only in which lines they accept and where the
+# fields sit; the layout is fixed per file, so each loop carries no dispatch.
+# Line i spans buf[line_start[i]:line_end[i]], so the outputs are sized
+# exactly once.  Like _rows4/_rows8, lines of the other layout, blank and
+# '#' lines, and lines with an unparsable field are skipped.
+
+@_jit
+def _parse_buffer4(buf, line_start, line_end):
+    """Scan 'blkerr biterrs enc dec' lines held in a uint8 array."""
+    n_lines = line_start.shape[0]
+    blkerr = np.empty(n_lines, dtype=np.int32)
+    biterrs = np.empty(n_lines, dtype=np.int32)
+    enc = np.empty(n_lines, dtype=np.float32)
+    dec = np.empty(n_lines, dtype=np.float32)
+    tok_s = np.empty(8, dtype=np.int64)
+    tok_e = np.empty(8, dtype=np.int64)
+
+    k = 0
+    for ln in range(n_lines):
+        if _tokenize(buf, line_start[ln], line_end[ln], tok_s, tok_e) != 4:
+            continue
+        be, bi, et, dt, ok = _scan_fields(buf, tok_s, tok_e, 0)
+        if not ok:
+            continue
+        blkerr[k] = be
+        biterrs[k] = bi
+        enc[k] = et
+        dec[k] = dt
+        k += 1
+
+    return blkerr[:k].copy(), biterrs[:k].copy(), enc[:k].copy(), dec[:k].copy()
+
+
+@_jit
+def _parse_buffer8(buf, line_start, line_end):
+    """Scan 'k n esno nblk blk bit enc dec …' lines held in a uint8 array."""
+    n_lines = line_start.shape[0]
+    blkerr = np.empty(n_lines, dtype=np.int32)
+    biterrs = np.empty(n_lines, dtype=np.int32)
+    enc = np.empty(n_lines, dtype=np.float32)
+    dec = np.empty(n_lines, dtype=np.float32)
+    tok_s = np.empty(8, dtype=np.int64)
+    tok_e = np.empty(8, dtype=np.int64)
+
+    k = 0
+    for ln in range(n_lines):
+        if _tokenize(buf, line_start[ln], line_end[ln], tok_s, tok_e) < 8:
+            continue
+        be, bi, et, dt, ok = _scan_fields(buf, tok_s, tok_e, 4)
+        if not ok:
+            continue
+        blkerr[k] = be
+        biterrs[k] = bi
+        enc[k] = et
+        dec[k] = dt
+        k += 1
+
+    return blkerr[:k].copy(), biterrs[:k].copy(), enc[:k].copy(), dec[:k].copy()
+# ---------------------------------------------------------------------------
+
+
+def _parse_lines(p: Path, wide: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Line-by-line fallback parser – skips every line it cannot make sense of."""
+    # size the outputs from the file length (≈20 bytes per line), grow if short
+    with p.open("rb") as fh:
+        return _collect((_rows8 if wide else _rows4)(_data_lines(fh)),
+                        cap=max(1024, p.stat().st_size // 20))
+
+
+def _collect(rows, cap: int = 16) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fill the int32 / float32 columns from (blkerr, biterrs, enc, dec) tuples."""
+    blkerr = np.empty(cap, dtype=np.int32)
+    biterrs = np.empty(cap, dtype=np.int32)
+    enc = np.empty(cap, dtype=np.float32)
+    dec = np.empty(cap, dtype=np.float32)
+    k = 0
+    for be, bi, et, dt in rows:
+        if k == cap:
+            cap *= 2
+            blkerr, biterrs, enc, dec = (np.resize(a, cap) for a in (blkerr, biterrs, enc, dec))
+        blkerr[k] = be
+        biterrs[k] = bi
+        enc[k] = et
+        dec[k] = dt
+        k += 1
+
+    return blkerr[:k].copy(), biterrs[:k].copy(), enc[:k].copy(), dec[:k].copy()
+
+
+def _fits_int32(row) -> bool:
+    """True when both counts of *row* fit the int32 output columns."""
+    return _I32_MIN <= row[0] <= _I32_MAX and _I32_MIN <= row[1] <= _I32_MAX
+
+
+# Cheap stand-ins for the grammar above: a digit run after the sign, and only
+# decimal characters before float(); int() / float() reject what slips past.
+# Counts shorter than 10 characters always fit in int32.
+def _rows4(lines):
+    """Yield (blkerr, biterrs, enc, dec) from 'blkerr biterrs enc dec' lines."""
+    for parts in lines:
+        if len(parts) != 4:
+            continue
+        be, bi, et, dt = parts
+        if (be.lstrip(b"+-").isdigit() and bi.lstrip(b"+-").isdigit()
+                and not et.translate(None, _FLOAT_CHARS) and not dt.translate(None, _FLOAT_CHARS)):
+            try:
+                row = int(be), int(bi), float(et), float(dt)
+            except ValueError:                      # "+-1", "1e", "1.2.3", …
+                continue
+            if len(be) < 10 and len(bi) < 10 or _fits_int32(row):
+                yield row
+
+
+def _rows8(lines):
+    """Yield (blkerr, biterrs, enc, dec) from 'k n esno nblk blk bit enc dec …' lines."""
+    for parts in lines:
+        if len(parts) < 8:
+            continue
+        be, bi, et, dt = parts[4:8]
+        if (be.lstrip(b"+-").isdigit() and bi.lstrip(b"+-").isdigit()
+                and not et.translate(None, _FLOAT_CHARS) and not dt.translate(None, _FLOAT_CHARS)):
+            try:
+                row = int(be), int(bi), float(et), float(dt)
+            except ValueError:
+                continue
+            if len(be) < 10 and len(bi) < 10 or _fits_int32(row):
+                yield row
+
+
+def _empty_columns() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     return (
-        np.asarray(blkerr_lst, dtype=np.int32),
-        np.asarray(biterrs_lst, dtype=np.int32),
-        np.asarray(enc_lst, dtype=np.float32),
-        np.asarray(dec_lst, dtype=np.float32),
+        np.empty(0, dtype=np.int32),
+        np.empty(0, dtype=np.int32),
+        np.empty(0, dtype=np.float32),
+        np.empty(0, dtype=np.float32),
     )
 
 
@@ -127,36 +705,57 @@ def parse_one_log(path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.nd
 
 def calc_rates(blkerr: np.ndarray, biterrs: np.ndarray, bits_per_block: int | None = None) -> tuple[float, float]:
     """Compute BLER and BER."""
-    if len(blkerr) == 0:
+    n_blk = blkerr.size
+    if n_blk == 0:
         raise ValueError("Empty input – cannot compute rates.")
-    bler = float(blkerr.mean())
+    # one int64 pass per array – no int32 overflow on long runs
+    s_blk = int(np.add.reduce(blkerr, dtype=np.int64))
+    s_bit = int(np.add.reduce(biterrs, dtype=np.int64))
+    bler = s_blk / n_blk
     if bits_per_block and bits_per_block > 0:
-        ber = biterrs.sum() / (bits_per_block * len(blkerr))
+        ber = s_bit / (bits_per_block * n_blk)
     else:
-        ber = float(biterrs.mean())  # fallback
+        ber = s_bit / n_blk  # fallback
     return bler, ber
 
 
-def plot_hist(
+# --- per-stub loading (process pool) ------------------------------
+def _parse_one_stub(
+    job: tuple[str, list[Path], int | None],
+) -> tuple[str, tuple[np.ndarray, np.ndarray, float, float]]:
+    """Worker: parse every log of one stub and attach its BLER/BER."""
+    stub, files, bits_per_block = job
+    blk, bit, enc, dec = parse_logs(*files)
+    bler, ber          = calc_rates(blk, bit, bits_per_block)
+    return stub, (enc, dec, bler, ber)
+
+def _load_stubs(
+    stub_logs: dict[str, list[Path]],
+    bits_per_block: int | None,
+) -> dict[str, tuple[np.ndarray, np.ndarray, float, float]]:
+    """Return {stub: (enc, dec, bler, ber)}, parsing independent stubs in parallel."""
+    jobs = [(stub, files, bits_per_block) for stub, files in sorted(stub_logs.items())]
+    if len(jobs) == 1:                            # not worth spawning a pool
+        return dict(map(_parse_one_stub, jobs))
+    # fork starts every worker up front → never more than there are jobs
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+        return dict(ex.map(_parse_one_stub, jobs, chunksize=1))
+
+
+def _render_pair(
+    ax1: plt.Axes,
+    ax2: plt.Axes,
     enc_t: np.ndarray,
     dec_t: np.ndarray,
-    bler: float,
-    ber: float,
     *,
     bins: int = 50,
-    stub: str | None = None,
-    show: bool = True,
     smooth: bool = False,
-) -> plt.Figure:
-    """
-    Create histograms for encoding / decoding times and return the Figure.
+) -> None:
+    """Clear *ax1* / *ax2* and draw the encoding / decoding histograms into them."""
+    ax1.cla()
+    ax2.cla()
 
-    If `show` is True (default) the plot window is displayed.
-    When `stub` is provided it is used as a figure title – handy for PDF pages.
-    """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
-
-    ax1.hist(enc_t, bins=bins, color="steelblue", edgecolor="black", alpha=0.7, density=smooth)
+    _draw_hist(ax1, enc_t, bins, "steelblue", density=smooth)
     ax1.set_title("Encoding time distribution")
     ax1.set_xlabel("Time (µs)")
     ax1.set_ylabel("Count" if not smooth else "Density")
@@ -165,7 +764,7 @@ def plot_hist(
         xs = np.linspace(enc_t.min(), enc_t.max(), 300)
         ax1.plot(xs, gaussian_kde(enc_t)(xs), color="navy", lw=1.5)
 
-    ax2.hist(dec_t, bins=bins, color="salmon", edgecolor="black", alpha=0.7, density=smooth)
+    _draw_hist(ax2, dec_t, bins, "salmon", density=smooth)
     ax2.set_title("Decoding time distribution")
     ax2.set_xlabel("Time (µs)")
     ax2.set_ylabel("Count" if not smooth else "Density")
@@ -174,12 +773,41 @@ def plot_hist(
         xs = np.linspace(dec_t.min(), dec_t.max(), 300)
         ax2.plot(xs, gaussian_kde(dec_t)(xs), color="darkred", lw=1.5)
 
+def plot_hist(
+    enc_t: np.ndarray,
+    dec_t: np.ndarray,
+    bler: float,
+    ber: float,
+    *,
+    bins: int = 50,
+    stub: str | None = None,
+    show: bool = True,
+    smooth: bool = False,
+    fig: plt.Figure | None = None,
+) -> plt.Figure:
+    """
+    Create histograms for encoding / decoding times and return the Figure.
+
+    If `show` is True (default) the plot window is displayed.
+    When `stub` is provided it is used as a figure title – handy for PDF pages.
+    Pass the Figure returned by an earlier call as `fig` to redraw into it
+    instead of building a new one (e.g. one PDF page per stub).
+    """
+    if fig is None:
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
+    else:
+        ax1, ax2 = fig.axes[:2]
+        for t in [t for t in fig.texts if t.get_gid() == "rates"]:
+            t.remove()
+
+    _render_pair(ax1, ax2, enc_t, dec_t, bins=bins, smooth=smooth)
+
     txt = f"BLER = {bler:.4f}\nBER  = {ber:.4e}"
-    fig.text(0.92, 0.5, txt, transform=fig.transFigure, fontsize=12, va="center", ha="left")
+    fig.text(0.92, 0.5, txt, transform=fig.transFigure, fontsize=12, va="center", ha="left",
+             gid="rates")
 
-    if stub:
-        fig.suptitle(stub)
-    plt.tight_layout(rect=[0, 0, 0.9, 1])
+    fig.suptitle(stub or "")
+    fig.tight_layout(rect=[0, 0, 0.9, 1])
     if show:
         plt.show()
     return fig
@@ -195,7 +823,8 @@ def _grid_hists(
 
     • fig_enc  – grid of encoding-time histograms
     • fig_dec  – grid of decoding-time histograms
-    Every subplot is titled with its stub name and annotated with BLER/BER.
+    Every subplot is titled with its stub name and BLER/BER;
+    stubs with fewer than 2·bins samples get a bare "stub / n=…" placeholder.
     """
     n = len(stub_data)
     cols = 3 if n > 4 else 2
@@ -208,46 +837,38 @@ def _grid_hists(
     axes_enc = np.atleast_2d(axes_enc)
     axes_dec = np.atleast_2d(axes_dec)
 
-    for idx, (stub, (enc, dec, bler, ber)) in enumerate(sorted(stub_data.items())):
+    items = sorted(stub_data.items())
+    for idx, (stub, (enc, dec, bler, ber)) in enumerate(items):
         r, c = divmod(idx, cols)
 
+        if enc.size < 2 * bins:                     # run has barely started – no bars
+            for ax in (axes_enc[r, c], axes_dec[r, c]):
+                ax.set_axis_off()
+                ax.text(0.5, 0.5, f"{stub}\nn={enc.size}", transform=ax.transAxes,
+                        ha="center", va="center", fontsize=9)
+            continue
+
+        # bin both metrics while this stub's arrays are hot, then draw both pages
+        h_enc = _fast_hist(enc, bins, density=smooth)
+        h_dec = _fast_hist(dec, bins, density=smooth)
+
         ax_e = axes_enc[r, c]
-        ax_e.hist(enc, bins=bins, color="steelblue", edgecolor="black", alpha=0.7, density=smooth)
-        ax_e.set_title(stub)
+        _draw_bars(ax_e, *h_enc, "steelblue")
+        ax_e.set_title(f"{stub}\nBLER={bler:.4f} BER={ber:.3e}", fontsize=9)
         ax_e.set_xlabel("Enc time (µs)")
         ax_e.set_ylabel("Cnt" if not smooth else "Density")
         if smooth and gaussian_kde is not None and len(enc) > 1:
             xs = np.linspace(enc.min(), enc.max(), 300)
             ax_e.plot(xs, gaussian_kde(enc)(xs), color="navy", lw=1)
-        ax_e.text(
-            0.98,
-            0.95,
-            f"BLER={bler:.4f}\nBER={ber:.3e}",
-            transform=ax_e.transAxes,
-            ha="right",
-            va="top",
-            fontsize=8,
-            bbox=dict(boxstyle="round", fc="white", ec="gray", alpha=0.8),
-        )
 
         ax_d = axes_dec[r, c]
-        ax_d.hist(dec, bins=bins, color="salmon", edgecolor="black", alpha=0.7, density=smooth)
-        ax_d.set_title(stub)
+        _draw_bars(ax_d, *h_dec, "salmon")
+        ax_d.set_title(f"{stub}\nBLER={bler:.4f} BER={ber:.3e}", fontsize=9)
         ax_d.set_xlabel("Dec time (µs)")
         ax_d.set_ylabel("Cnt" if not smooth else "Density")
         if smooth and gaussian_kde is not None and len(dec) > 1:
             xs = np.linspace(dec.min(), dec.max(), 300)
             ax_d.plot(xs, gaussian_kde(dec)(xs), color="darkred", lw=1)
-        ax_d.text(
-            0.98,
-            0.95,
-            f"BLER={bler:.4f}\nBER={ber:.3e}",
-            transform=ax_d.transAxes,
-            ha="right",
-            va="top",
-            fontsize=8,
-            bbox=dict(boxstyle="round", fc="white", ec="gray", alpha=0.8),
-        )
 
     # hide unused axes
     for fig, axes in ((fig_enc, axes_enc), (fig_dec, axes_dec)):
@@ -295,6 +916,9 @@ def overlay_hists(
     return fig
 
 # ---------- summary-file support -------------------------------------------
+_SUMMARY_INT = re.compile(r"[+-]?[0-9]+")            # k and n tokens
+
+
 def parse_summary_files(*paths: str | Path,
                         k: int | None = None,
                         n: int | None = None
@@ -309,26 +933,51 @@ def parse_summary_files(*paths: str | Path,
     • If k and/or n are given, only lines that match those values are used.
     """
 
+    def parse_row(k_s: str, n_s: str, esno_s: str, dec_s: str) -> tuple[float, float] | None:
+        """(esno, avg_dec) if the tokens are a matching line, else None (nan times are kept)."""
+        if not (_SUMMARY_INT.fullmatch(k_s) and _SUMMARY_INT.fullmatch(n_s)):
+            return None                     # k and n must be integers (“64.0” is not)
+        if (k is not None and int(k_s) != k) or (n is not None and int(n_s) != n):
+            return None
+        try:
+            return float(esno_s), float(dec_s)
+        except ValueError:
+            return None                     # skip non-numeric line
+
     def consume_file(p: Path, store: dict[str, tuple[float, float]]) -> None:
         """Read one summary file and update *store* (at most one entry per file)."""
+        if _pandas() is not None:
+            try:                            # one C-engine call: k n esno … avg_dec
+                df = pd.read_csv(p, sep=r"\s+", comment="#", header=None, engine="c",
+                                 usecols=[0, 1, 2, 7], dtype=str, keep_default_na=False,
+                                 encoding_errors="ignore")
+            except ValueError:              # short / ragged / empty → line by line
+                pass
+            else:
+                df.columns = ["k", "n", "esno", "dec"]
+                for col, want in (("k", k), ("n", n)):
+                    if want is not None:    # cheap pre-filter; parse_row() has the last word
+                        df = df[pd.to_numeric(df[col], errors="coerce") == want]
+                for tokens in df.itertuples(index=False):
+                    row = parse_row(*tokens)
+                    if row is not None:     # only first matching line per file
+                        store[p.stem] = row
+                        break
+                return
+        consume_lines(p, store)
+
+    def consume_lines(p: Path, store: dict[str, tuple[float, float]]) -> None:
+        """Line-by-line variant of consume_file() for files pandas rejects."""
         stub = p.stem                       # filename without extension
         with p.open(encoding="utf-8", errors="ignore") as fh:
             for line in fh:
-                if not line.strip() or line.lstrip().startswith("#"):
-                    continue
-                parts = line.split()
+                parts = line.split("#", 1)[0].split()   # '#' starts a comment, as for pandas
                 if len(parts) < 8:          # need k n esno n_blk blkerr biterr avg_enc avg_dec
                     continue
-                try:
-                    k_i, n_i = map(int, parts[:2])
-                except ValueError:
-                    continue          # skip non-numeric line
-                if (k is not None and k_i != k) or (n is not None and n_i != n):
-                    continue
-                esno      = float(parts[2])
-                avg_dec_t = float(parts[7])
-                store[stub] = (esno, avg_dec_t)
-                break                       # only first matching line per file
+                row = parse_row(parts[0], parts[1], parts[2], parts[7])
+                if row is not None:
+                    store[stub] = row
+                    break                   # only first matching line per file
 
     result: dict[str, tuple[float, float]] = {}
 
@@ -363,8 +1012,7 @@ def plot_esno_vs_dec(data: dict[str, tuple[float, float]]) -> plt.Figure:
 def plot_enc_hist(enc_t: np.ndarray, bler: float, ber: float,
                   stub: str, bins: int = 50) -> plt.Figure:
     fig, ax = plt.subplots(figsize=(6, 4))
-    ax.hist(enc_t, bins=bins, color="steelblue",
-            edgecolor="black", alpha=0.7)
+    _draw_hist(ax, enc_t, bins, "steelblue")
     ax.set_title(f"{stub} – Encoding time")
     ax.set_xlabel("Time (µs)")
     ax.set_ylabel("Count")
@@ -378,7 +1026,7 @@ def plot_enc_hist(enc_t: np.ndarray, bler: float, ber: float,
 def plot_dec_hist(dec_t: np.ndarray, bler: float, ber: float,
                   stub: str, bins: int = 50) -> plt.Figure:
     fig, ax = plt.subplots(figsize=(6, 4))
-    ax.hist(dec_t, bins=bins, color="salmon", edgecolor="black", alpha=0.7)
+    _draw_hist(ax, dec_t, bins, "salmon")
     ax.set_title(f"{stub} – Decoding time")
     ax.set_xlabel("Time (µs)")
     ax.set_ylabel("Count")
@@ -397,16 +1045,32 @@ def find_logs_by_stub(k: int, n: int,
     """
     dirpath = Path(directory).expanduser()
     stub_map: dict[str, list[Path]] = {}
-    for ext in exts:
-        pattern = f"*_{k}_{n}*{ext}" if ext else f"*_{k}_{n}*"
-        for p in dirpath.glob(pattern):
-            if not p.is_file():
+    wanted = f"_{k}_{n}"
+    with os.scandir(dirpath) as it:               # one readdir covers every ext
+        for entry in it:
+            name = entry.name
+            if wanted not in name or not entry.is_file():
+                continue
+            stub, suf = _split_stub(name, k, n)
+            if suf not in exts:
                 continue
-            stem = p.stem
-            stub = stem.split(f"_{k}_{n}", 1)[0] or stem      # derive stub
-            stub_map.setdefault(stub, []).append(p)
+            stub_map.setdefault(stub, []).append(Path(entry.path))
     return stub_map
 
+
+def _split_stub(name: str, k: int, n: int) -> tuple[str, str]:
+    """
+    Split the file name '<stub>_<k>_<n>…<ext>' into (stub, ext).
+    Dots before '_<k>_<n>' belong to the stub ('bp_v1.2_64_128_1000' → 'bp_v1.2');
+    without a stub in front of it, or without '_<k>_<n>' at all, the stem is used.
+    """
+    before, found, after = name.partition(f"_{k}_{n}")
+    if not found:
+        return Path(name).stem, Path(name).suffix
+    dot = after.rfind(".")                                   # output prefixes may contain dots
+    suf = after[dot:] if dot >= 0 else ""
+    return before or name[:len(name) - len(suf)], suf
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Parse simulation logs and plot statistics.")
     parser.add_argument("logs", nargs="*", help="Path(s) to log files")   # CHANGED ‘+’ → ‘*’
@@ -427,6 +1091,12 @@ def main() -> None:
                              "pair into common axes (forces smoothed / KDE view)")
     args = parser.parse_args()
 
+    # Runs that only write files (--out, or the automatic --k/--n mode) never open a
+    # window → skip the GUI backend probe.  pyplot picks its backend at the first figure.
+    if args.out or (args.k is not None and args.n is not None and not args.logs
+                    and not args.summary and not args.overlay):
+        matplotlib.use("Agg", force=True)
+
     # Graceful warning if --smooth requested but scipy not found
     if args.smooth and gaussian_kde is None:
         print("⚠️  SciPy not found – smooth histograms disabled.")
@@ -484,9 +1154,7 @@ def main() -> None:
                 else:                               # single file
                     if not p.is_file():
                         continue
-                    # derive stub from filename before '_k_n'
-                    stem = p.stem
-                    stub = stem.split(f"_{args.k}_{args.n}", 1)[0] or stem
+                    stub = _split_stub(p.name, args.k, args.n)[0]
                     stub_logs.setdefault(stub, []).append(p)
         else:                                       # no --logs → auto search in cwd
             stub_logs = find_logs_by_stub(args.k, args.n)
@@ -494,11 +1162,7 @@ def main() -> None:
         if not stub_logs:
             parser.error("No log files found for overlay.")
 
-        stub_data: dict[str, tuple[np.ndarray, np.ndarray, float, float]] = {}
-        for stub, flist in sorted(stub_logs.items()):
-            blk, bit, enc, dec = parse_logs(*flist)
-            bler, ber          = calc_rates(blk, bit, args.bits_per_block)
-            stub_data[stub]    = (enc, dec, bler, ber)
+        stub_data = _load_stubs(stub_logs, args.bits_per_block)
 
         fig = overlay_hists(stub_data, metric=args.metric)
 
@@ -521,11 +1185,7 @@ def main() -> None:
             parser.error(f"No log files matching '*_{args.k}_{args.n}*' found.")
         out_path = Path(args.out or f"histograms_{args.k}_{args.n}.pdf")
         with PdfPages(out_path) as pdf:
-            stub_data: dict[str, tuple[np.ndarray, np.ndarray, float, float]] = {}
-            for stub, files in sorted(stub_logs.items()):
-                blk, bit, enc, dec = parse_logs(*files)
-                bler, ber = calc_rates(blk, bit, args.bits_per_block)
-                stub_data[stub] = (enc, dec, bler, ber)
+            stub_data = _load_stubs(stub_logs, args.bits_per_block)
 
             fig_enc, fig_dec = _grid_hists(stub_data, bins=args.bins, smooth=args.smooth)
             pdf.savefig(fig_dec)   # page 1 – decoding hists (often the key metric)
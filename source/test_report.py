@@ -0,0 +1,200 @@
+"""Tests for report.py – run with `python -m pytest` from the source directory."""
+
+import os
+
+import matplotlib
+matplotlib.use("Agg")                               # before report pulls in pyplot
+
+import numpy as np
+import pytest
+
+import report
+
+
+def _cols(arrays):
+    return [a.tolist() for a in arrays]
+
+
+def test_chunked_reader_skips_over_wide_first_line(tmp_path):
+    if report._pandas() is None:                    # imported lazily by report
+        pytest.skip("pandas not installed")
+    p = tmp_path / "wide_first.log"
+    p.write_text("0 0 12 34 5\n1 2 3 4\n2 3 5 6\n7 8 9 10\n")
+    assert _cols(report._read_columns_chunked(p, wide=False)) == [
+        [1, 2, 7], [2, 3, 8], [3.0, 5.0, 9.0], [4.0, 6.0, 10.0],
+    ]
+
+
+def test_chunked_reader_skips_over_wide_later_lines(tmp_path):
+    if report._pandas() is None:                    # imported lazily by report
+        pytest.skip("pandas not installed")
+    p = tmp_path / "wide_later.log"
+    p.write_text("1 2 3 4\n0 0 12 34 5\n0 0 12 34 5 6 7\n2 3 5 6\n")
+    assert _cols(report._read_columns_chunked(p, wide=False)) == [
+        [1, 2], [2, 3], [3.0, 5.0], [4.0, 6.0],
+    ]
+
+
+# One log per awkward case; every parser path must agree with _parse_lines().
+_LOGS = {
+    "comments_blanks": b"# header\n1 2 3 4\n\n   \n# 9 9 9 9\n5 6 7.5 8e1\n",
+    "crlf": b"1 2 3 4\r\n5 6 7 8\r\n# c\r\n9 10 11 12\r\n",
+    "no_final_newline": b"1 2 3 4\n5 6 7 8",
+    "mixed_4_first": b"1 2 3 4\n64 128 2.5 1000 5 6 7 8\n9 10 11 12\n",
+    "mixed_8_first": b"64 128 2.5 1000 1 2 3 4\n5 6 7 8\n64 128 2.5 1000 9 10 11 12 extra\n",
+    "stray_wide_short": b"0 0 12 34 5\n1 2 3 4\n1 2\n1 2 3\n5 6 7 8 9 10 11\n9 10 11 12\n",
+    "nan_inf": b"1 2 3 4\n2 3 nan 6\n3 4 5 inf\n64 128 2.5 1000 5 6 7 8\n",
+    "inline_comment_float_count": b"0 0 12 34 # note\n1.0 0 12 34\n1 2 .5 5.\n0x1 1 1 1\n",
+    "embedded_cr": b"1 2\r3 4\n5 6 7 8\n# x\r9 9 9 9\n10 11 12 13\n",
+    "count_overflow": (b"3000000000 1 2 3\n1 2 3 4\n-2147483648 2147483647 5 6\n"
+                       b"2147483648 0 1 1\n0 99999999999999999999 1 1\n0000000007 8 9 10\n"),
+    "empty": b"",
+}
+
+_PATHS = {                                          # the parsers _read_columns() may pick
+    "cython": (),
+    "numba": ("_parse_native",),
+    "pandas": ("_parse_native", "numba"),
+    "loadtxt": ("_parse_native", "numba", "pd"),
+}
+
+
+
+def _counting_reader(monkeypatch):
+    calls = []
+    read = report._read_columns
+    monkeypatch.setattr(report, "_read_columns", lambda p: calls.append(p) or read(p))
+    return calls
+
+
+def test_load_cached_reuses_a_fresh_cache(tmp_path, monkeypatch):
+    calls = _counting_reader(monkeypatch)
+    p = tmp_path / "a_64_128.log"
+    p.write_bytes(b"1 2 3 4\n5 6 7 8\n")
+    first = report._load_cached(p)
+    again = report._load_cached(p)
+    assert len(calls) == 1 and (tmp_path / "a_64_128.log.npz").is_file()
+    assert _cols(again) == _cols(first) == [[1, 5], [2, 6], [3, 7], [4, 8]]
+
+
+@pytest.mark.parametrize("change", ["mtime", "size", "version"])
+def test_load_cached_reparses_a_stale_cache(tmp_path, monkeypatch, change):
+    calls = _counting_reader(monkeypatch)
+    p = tmp_path / "a_64_128.log"
+    p.write_bytes(b"1 2 3 4\n")
+    report._load_cached(p)
+    st = p.stat()
+    if change == "mtime":
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    elif change == "size":                          # same mtime, one more line
+        p.write_bytes(b"1 2 3 4\n5 6 7 8\n")
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        monkeypatch.setattr(report, "_CACHE_VERSION", report._CACHE_VERSION + 1)
+    got = report._load_cached(p)
+    assert len(calls) == 2
+    assert _cols(got) == _cols(report._parse_lines(p, False))
+    report._load_cached(p)                          # ...and the rewritten cache is used
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("fails", ["mkstemp", "replace"])
+def test_load_cached_without_a_writable_directory(tmp_path, monkeypatch, fails):
+    def refuse(*args, **kwargs):                    # chmod does not stop root, so fail here
+        raise PermissionError(13, "Permission denied")
+    monkeypatch.setattr(report.tempfile if fails == "mkstemp" else report.os, fails, refuse)
+    p = tmp_path / "a_64_128.log"
+    p.write_bytes(b"1 2 3 4\n")
+    assert _cols(report._load_cached(p)) == [[1], [2], [3], [4]]
+    assert [q.name for q in tmp_path.iterdir()] == ["a_64_128.log"]   # no cache, no temp file
+
+@pytest.mark.parametrize("path", _PATHS)
+@pytest.mark.parametrize("name", _LOGS)
+def test_parser_paths_agree(tmp_path, monkeypatch, path, name):
+    available = {"cython": lambda: report._parse_native, "numba": report._numba,
+                 "pandas": report._pandas}.get(path)
+    if available is not None and available() is None:
+        pytest.skip(f"{path} not available")
+    for attr in _PATHS[path]:
+        monkeypatch.setattr(report, attr, None)
+    p = tmp_path / f"{name}.log"
+    p.write_bytes(_LOGS[name])
+
+    with p.open("rb") as fh:
+        width = report._first_width(report._data_lines(fh))
+    expected = report._parse_lines(p, width >= 8) if width else report._empty_columns()
+    got = report._read_columns(p)
+    assert [a.dtype for a in got] == [a.dtype for a in expected]
+    assert _cols(got) == _cols(expected)
+
+
+def test_find_logs_by_stub_keeps_dotted_output_prefix(tmp_path):
+    # run_test -o bp_v1.2 writes bp_v1.2_<k>_<n>_<nblock>
+    for name in ("bp_v1.2_64_128_1000", "bp_v1.2_64_128_1000.log", "a_64_128.out",
+                 "a_64_128.log.npz", "b_32_64_10"):
+        (tmp_path / name).touch()
+    found = report.find_logs_by_stub(64, 128, directory=tmp_path)
+    assert {stub: sorted(p.name for p in ps) for stub, ps in found.items()} == {
+        "bp_v1.2": ["bp_v1.2_64_128_1000", "bp_v1.2_64_128_1000.log"],
+    }
+
+
+
+def test_overlay_file_and_directory_agree_on_stub(tmp_path):
+    # a log named on the command line gets the same stub as one found in a directory
+    for name in ("bp_v1.2_64_128_1000", "bp_v1.2_64_128_1000.log", "_64_128.log"):
+        (tmp_path / name).touch()
+        stub = report._split_stub(name, 64, 128)[0]
+        assert report.find_logs_by_stub(64, 128, directory=tmp_path)[stub]
+        (tmp_path / name).unlink()
+    assert report._split_stub("bp_v1.2_64_128_1000", 64, 128) == ("bp_v1.2", "")
+    assert report._split_stub("_64_128.log", 64, 128) == ("_64_128", ".log")
+    assert report._split_stub("other.log", 64, 128) == ("other", ".log")
+
+def test_plot_hist_redraws_into_the_same_figure():
+    rng = np.random.default_rng(0)
+    enc, dec = rng.normal(100, 5, 500), rng.normal(900, 40, 500)
+    fig = report.plot_hist(enc, dec, 0.1, 0.01, stub="first", show=False, smooth=True)
+    counts = [(len(ax.patches), len(ax.lines)) for ax in fig.axes]
+    again = report.plot_hist(enc * 2, dec * 2, 0.2, 0.02, stub="second", show=False,
+                             smooth=True, fig=fig)
+
+    assert again is fig and len(fig.axes) == 2
+    assert [(len(ax.patches), len(ax.lines)) for ax in fig.axes] == counts
+    rates = [t for t in fig.texts if t.get_gid() == "rates"]
+    assert len(rates) == 1 and rates[0].get_text().startswith("BLER = 0.2000")
+    assert fig.get_suptitle() == "second"
+    report.plt.close(fig)
+
+
+def test_fast_hist_matches_numpy_on_integer_times():
+    x = np.arange(116, dtype=np.uint16)             # 69 lies exactly on edge 30 of 50
+    assert report._fast_hist(x, 50)[0].tolist() == np.histogram(x, 50)[0].tolist()
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        bins = int(rng.integers(5, 200))
+        x = rng.integers(0, rng.integers(1, 3000), rng.integers(1, 5000)).astype(np.uint16)
+        wide = rng.integers(0, 10**6, 5000)         # too wide a range for the per-value table
+        for data in (x, wide):
+            counts, edges = report._fast_hist(data, bins)
+            ref_counts, ref_edges = np.histogram(data, bins)
+            assert counts.tolist() == ref_counts.tolist()
+            assert np.array_equal(edges, ref_edges)
+
+
+@pytest.mark.parametrize("path", ["pandas", "lines"])
+def test_summary_paths_agree(tmp_path, monkeypatch, path):
+    if path == "pandas" and report._pandas() is None:
+        pytest.skip("pandas not installed")
+    if path == "lines":
+        monkeypatch.setattr(report, "pd", None)
+    (tmp_path / "nan_dec.out").write_text("64 128 1.6 10000 0 0 nan nan\n")
+    (tmp_path / "float_k.out").write_text("64.0 128 1.7 10000 0 0 5 6\n"
+                                          "64 abc 1.8 10000 0 0 5 6\n"
+                                          "64 128 1.9 10000 0 0 5 7\n")
+    (tmp_path / "other_n.out").write_text("64 256 2.0 10000 0 0 5 8\n")
+
+    got = report.parse_summary_files(tmp_path, k=64, n=128)
+    assert set(got) == {"nan_dec", "float_k"}
+    assert got["nan_dec"][0] == 1.6 and np.isnan(got["nan_dec"][1])
+    assert got["float_k"] == (1.9, 7.0)